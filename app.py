@@ -11,19 +11,28 @@ Features:
 - Week-long content plan output (7 posts)
 - Viral-optimized prompting for maximum engagement
 
-Requirements: streamlit, requests, bs4, json, re
+Requirements: streamlit, requests, lxml, together
 Usage: streamlit run app.py
 """
 
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
+import io
+import os
 import json
+import random
 import re
-from urllib.parse import quote_plus
+import asyncio
+import functools
+import hashlib
+import threading
+from collections import deque
+from urllib.parse import urlencode
 import time
-from typing import List, Dict, Optional
-from together import Together
+from typing import Callable, List, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+    from together import Together
 
 # Page configuration
 st.set_page_config(
@@ -36,6 +45,47 @@ st.set_page_config(
 # Constants
 GOOGLE_NEWS_BASE_URL = "https://news.google.com/rss/search"
 DEFAULT_MODEL = "meta-llama/Llama-3-8b-chat-hf"
+STREAM_FLUSH_INTERVAL = 0.05  # Seconds between UI refreshes while streaming
+NEWS_CACHE_TTL = 1800  # Default seconds to reuse scraped headlines
+NEWS_CACHE_MAX_AGE = 3600  # Ceiling for feed-provided max-age, keeps news fresh
+NEWS_CACHE_MAX_ENTRIES = 128
+MAX_INPUT_CHARS = 2000  # Cap on bio/recent post length sent to the model
+MAX_PROMPT_HEADLINES = 20  # Matches the headlines slider ceiling
+TOGETHER_MAX_RETRIES = 3
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read an integer setting from the environment, falling back on bad values and clamping to minimum."""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        value = default
+    return max(value, minimum)
+
+TOGETHER_MAX_CONCURRENCY = _env_int("TOGETHER_MAX_CONCURRENCY", 4, 1)
+TOGETHER_TPM_LIMIT = _env_int("TOGETHER_TPM_LIMIT", 0, 0)  # 0 disables the budget
+
+# Precompiled patterns used on the scrape and parse paths
+_WS = re.compile(r'\s+')
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+_NON_WORD_RE = re.compile(r'\W+')
+_SOURCE_SUFFIX_RE = re.compile(r'\s+-\s+[^-]+$')  # Google News appends " - Outlet"
+_DAY_RE = re.compile(r'\*\*Day (\d+):[^*]*\*\*', re.IGNORECASE)
+
+# Process-wide headline cache: (keyword, max_headlines) -> (expires_at, headlines)
+_NEWS_CACHE: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+_NEWS_CACHE_LOCK = threading.Lock()
+
+# Bounds concurrent Together.ai generations across all sessions of this process
+_TOGETHER_SEM = threading.BoundedSemaphore(TOGETHER_MAX_CONCURRENCY)
+
+# Rolling one-minute token usage: (timestamp, total_tokens)
+_TOKEN_USAGE: deque = deque()
+_TOKEN_USAGE_LOCK = threading.Lock()
+
+# Conditional-GET validators: (url, max_headlines) -> (etag, last_modified, headlines)
+_ETAG_CACHE: Dict[Tuple[str, int], Tuple[Optional[str], Optional[str], List[str]]] = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+
 
 # Viral content frameworks
 VIRAL_FRAMEWORKS = [
@@ -48,78 +98,51 @@ VIRAL_FRAMEWORKS = [
     "Industry myth-busting with facts"
 ]
 
-class NewsScraperError(Exception):
-    """Custom exception for news scraping errors"""
-    pass
+# Static sidebar content, built once at import rather than on every rerun
+_SIDEBAR_STRATEGY_MD = """### 🎯 Viral Content Strategy:
 
-class TogetherAPIError(Exception):
-    """Custom exception for Together.ai API errors"""
-    pass
+1. **Profile Analysis**: Bio + recent post voice matching
+2. **Industry Intelligence**: Real-time news integration
+3. **Viral Framework**: 7 strategic content types
+4. **Engagement Optimization**: Psychological triggers included"""
 
-def scrape_google_news(industry_keyword: str, max_headlines: int = 10) -> List[str]:
-    """
-    Scrape recent industry news headlines from Google News RSS feed.
-    
-    Args:
-        industry_keyword: The industry/topic to search for
-        max_headlines: Maximum number of headlines to return
-        
-    Returns:
-        List of news headlines
-        
-    Raises:
-        NewsScraperError: If scraping fails
-    """
-    try:
-        # Construct Google News RSS URL
-        search_query = f"{industry_keyword} industry news"
-        encoded_query = quote_plus(search_query)
-        url = f"{GOOGLE_NEWS_BASE_URL}?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
-        
-        # Set headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # Make request with timeout
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse RSS feed
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('item')
-        
-        headlines = []
-        for item in items[:max_headlines]:
-            title = item.find('title')
-            if title and title.text:
-                # Clean up title text
-                clean_title = re.sub(r'\s+', ' ', title.text.strip())
-                headlines.append(clean_title)
-        
-        return headlines
-        
-    except requests.RequestException as e:
-        raise NewsScraperError(f"Failed to fetch news: {str(e)}")
-    except Exception as e:
-        raise NewsScraperError(f"Failed to parse news feed: {str(e)}")
+_SIDEBAR_VIRAL_TYPES_MD = """### 🔥 Viral Content Types:
 
-def construct_viral_prompt(bio: str, recent_post: str, industry: str, headlines: List[str]) -> str:
-    """
-    Construct an enhanced, viral-optimized prompt for Together.ai API.
-    
-    Args:
-        bio: User's LinkedIn bio
-        recent_post: User's recent LinkedIn post
-        industry: User's industry
-        headlines: List of current industry news headlines
-        
-    Returns:
-        Formatted prompt string optimized for viral content
-    """
-    headlines_text = "\n".join([f"• {headline}" for headline in headlines])
-    
-    prompt = f"""You are an elite LinkedIn ghostwriter and viral content strategist with expertise in creating thought leadership content that achieves maximum engagement, shares, and industry influence. Your mission is to craft a strategic 7-day content calendar that positions the user as an authoritative voice while driving exceptional viral performance.
+- **Controversial Takes**: Challenge industry norms
+- **Behind-the-Scenes**: Exclusive insights
+- **Bold Predictions**: Data-backed forecasts
+- **Failure Stories**: Vulnerability + lessons
+- **Myth-Busting**: Debunk misconceptions
+- **Trend Analysis**: Connect news to insights
+- **Contrarian Views**: Unpopular but valuable"""
+
+_SIDEBAR_ENGAGEMENT_MD = """### 💡 Engagement Maximizers:
+
+- Strong hooks in first 2 lines
+- Curiosity gaps and open loops
+- Interactive call-to-actions
+- Strategic hashtag placement
+- Emotional storytelling"""
+
+_SIDEBAR_APIKEY_MD = """### 🔑 Get Together.ai API Key:
+
+[Sign up at Together.ai](https://together.ai)
+
+✨ **Free Credits Available!**
+New users get free credits to try the service."""
+
+# Per-day posting tips shown under every generated post
+_POSTING_TIPS_MD = """**💡 Posting Tips:**
+
+- Post during peak hours (8-10 AM, 12-2 PM, 5-6 PM)
+- Engage with comments within first 2 hours
+- Share in relevant LinkedIn groups
+- Tag relevant industry connections
+
+---"""
+
+# Viral prompt template, filled per request via str.format_map
+_VIRAL_TEMPLATE = """You are an elite LinkedIn ghostwriter and viral content strategist with expertise in creating thought leadership content that achieves maximum engagement, shares, and industry influence. Your mission is to craft a strategic 7-day content calendar that positions the user as an authoritative voice while driving exceptional viral performance.
 
 TARGET PROFILE ANALYSIS:
 Industry: {industry}
@@ -203,130 +226,472 @@ EXECUTION STANDARDS:
 
 Generate 7 strategically different posts that collectively build a powerful thought leadership narrative while maximizing viral potential across diverse content formats and engagement strategies."""
 
-    return prompt
+class NewsScraperError(Exception):
+    """Custom exception for news scraping errors"""
+    pass
+
+class TogetherAPIError(Exception):
+    """Custom exception for Together.ai API errors"""
+    pass
 
-def call_together_api(prompt: str, api_key: str, model: str = DEFAULT_MODEL) -> str:
+def scrape_google_news(industry_keyword: str, max_headlines: int = 10) -> List[str]:
     """
-    Call Together.ai API using the official Python SDK.
+    Scrape recent industry news headlines from Google News RSS feed.
+    
+    Results are cached per (industry, max_headlines) for the feed's
+    Cache-Control max-age (capped at NEWS_CACHE_MAX_AGE), so re-runs with a
+    tweaked bio or post skip the network round trip.
     
     Args:
-        prompt: The prompt to send to the API
-        api_key: Together.ai API key
-        model: Model to use for generation
+        industry_keyword: The industry/topic to search for
+        max_headlines: Maximum number of headlines to return
         
     Returns:
-        Generated content from the API
+        List of news headlines
         
     Raises:
-        TogetherAPIError: If API call fails
+        NewsScraperError: If scraping fails
     """
+    normalized_keyword = industry_keyword.lower().strip()
+    cache_key = (normalized_keyword, max_headlines)
+    now = time.monotonic()
+    
+    with _NEWS_CACHE_LOCK:
+        cached = _NEWS_CACHE.get(cache_key)
+        if cached and cached[0] > now:
+            return list(cached[1])
+    
+    headlines, max_age = _fetch_google_news(normalized_keyword, max_headlines)
+    ttl = min(max_age if max_age is not None else NEWS_CACHE_TTL, NEWS_CACHE_MAX_AGE)
+    
+    with _NEWS_CACHE_LOCK:
+        _NEWS_CACHE[cache_key] = (now + ttl, headlines)
+        # Evict the soonest-expiring entries once over capacity
+        while len(_NEWS_CACHE) > NEWS_CACHE_MAX_ENTRIES:
+            oldest = min(_NEWS_CACHE, key=lambda k: _NEWS_CACHE[k][0])
+            del _NEWS_CACHE[oldest]
+    
+    return list(headlines)
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> "requests.Session":
+    """
+    Return the shared HTTP session used for news fetches.
+    
+    requests is imported here rather than at module top so the first Streamlit
+    render does not pay for it; the session is built once per worker process
+    and reuses pooled keep-alive connections.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    ))
+    # Set headers to mimic a real browser
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    return session
+
+def _headline_fingerprint(headline: str) -> bytes:
+    """
+    Return a short hash identifying a story regardless of outlet or punctuation.
+    
+    The publisher suffix is dropped and only the first 80 word characters are
+    hashed, so the same story syndicated by several outlets collapses to one key.
+    """
+    story = _SOURCE_SUFFIX_RE.sub('', headline).lower()
+    canonical = _NON_WORD_RE.sub('', story)[:80]
+    return hashlib.blake2b(canonical.encode(), digest_size=8).digest()
+
+@functools.lru_cache(maxsize=256)
+def _news_url(industry: str) -> str:
+    """Build the Google News RSS search URL for an (already normalized) industry keyword."""
+    query = urlencode({
+        'q': f"{industry} industry news",
+        'hl': 'en-US',
+        'gl': 'US',
+        'ceid': 'US:en'
+    }, safe=':')
+    return f"{GOOGLE_NEWS_BASE_URL}?{query}"
+
+def _fetch_google_news(industry_keyword: str, max_headlines: int) -> Tuple[List[str], Optional[int]]:
+    """
+    Fetch and parse the Google News RSS feed for an industry keyword.
+    
+    Uncached; scrape_google_news owns the single max-age-aware cache layer.
+    
+    Args:
+        industry_keyword: The normalized (lowercased, stripped) industry/topic
+        max_headlines: Maximum number of headlines to return
+        
+    Returns:
+        Tuple of (headlines, Cache-Control max-age in seconds or None)
+        
+    Raises:
+        NewsScraperError: If scraping fails
+    """
+    import requests
+    from lxml import etree
+    
     try:
-        # Initialize Together client
-        client = Together(api_key=api_key)
+        # Construct Google News RSS URL
+        url = _news_url(industry_keyword)
         
-        # Create chat completion
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_tokens=3000,
-            temperature=0.8,
-            top_p=0.9,
-            repetition_penalty=1.1,
-            stop=["<|im_end|>", "<|endoftext|>"]
-        )
+        # Revalidate a previously seen feed instead of re-downloading it
+        validator_key = (url, max_headlines)
+        headers = {}
+        with _ETAG_CACHE_LOCK:
+            validators = _ETAG_CACHE.get(validator_key)
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
         
-        # Extract the generated content
-        if response.choices and len(response.choices) > 0:
-            return response.choices[0].message.content.strip()
+        # Make request with timeout over the pooled session
+        response = _get_session().get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        
+        if response.status_code == 304 and validators:
+            headlines = list(validators[2])
         else:
-            raise TogetherAPIError("No content generated by API")
+            # Stream-parse RSS items, skipping duplicate stories, until we have enough headlines
+            headlines = []
+            seen = set()
+            for _, item in etree.iterparse(io.BytesIO(response.content), tag='item'):
+                title = item.findtext('title')
+                item.clear()
+                if title and title.strip():
+                    # Clean up title text
+                    clean_title = _WS.sub(' ', title.strip())
+                    fingerprint = _headline_fingerprint(clean_title)
+                    if fingerprint in seen:
+                        continue
+                    seen.add(fingerprint)
+                    headlines.append(clean_title)
+                    if len(headlines) >= max_headlines:
+                        break
+            
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with _ETAG_CACHE_LOCK:
+                    _ETAG_CACHE[validator_key] = (etag, last_modified, headlines)
+                    # Drop the oldest validators once over capacity
+                    while len(_ETAG_CACHE) > NEWS_CACHE_MAX_ENTRIES:
+                        del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+        
+        # Honour the feed's freshness hint when present
+        max_age = None
+        max_age_match = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+        if max_age_match:
+            max_age = int(max_age_match.group(1))
+        
+        return headlines, max_age
+        
+    except requests.RequestException as e:
+        raise NewsScraperError(f"Failed to fetch news: {str(e)}") from e
+    except (etree.XMLSyntaxError, ValueError) as e:
+        raise NewsScraperError(f"Failed to parse news feed: {str(e)}") from e
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _get_together_client(api_key: str) -> "Together":
+    """
+    Return a Together client for the API key, shared across reruns and sessions.
+    
+    SDK-level retries are disabled so call_together_api owns all backoff and
+    never sleeps while holding a concurrency slot.
+    """
+    from together import Together
+    return Together(api_key=api_key, max_retries=0)
+
+async def gather_generation_inputs(industry_keyword: str, max_headlines: int,
+                                   api_key: str) -> List[str]:
+    """
+    Scrape industry news while constructing and caching the Together.ai client.
+    
+    Building the client does no network I/O; overlapping it with the scrape
+    only moves client setup (SDK import and HTTP client construction) off the
+    path after the news fetch, it does not hide any scrape latency.
+    
+    Args:
+        industry_keyword: The industry/topic to search for
+        max_headlines: Maximum number of headlines to return
+        api_key: Together.ai API key
         
-    except Exception as e:
-        raise TogetherAPIError(f"API request failed: {str(e)}")
+    Returns:
+        List of news headlines
+        
+    Raises:
+        NewsScraperError: If scraping fails
+    """
+    loop = asyncio.get_running_loop()
+    scrape_task = loop.run_in_executor(
+        None, functools.partial(scrape_google_news, industry_keyword, max_headlines)
+    )
+    together_warmup_task = loop.run_in_executor(
+        None, _get_together_client, api_key
+    )
+    headlines, _ = await asyncio.gather(scrape_task, together_warmup_task)
+    return headlines
 
-def parse_generated_content(content: str) -> Dict[str, str]:
+def construct_viral_prompt(bio: str, recent_post: str, industry: str, headlines: List[str]) -> str:
+    """
+    Construct an enhanced, viral-optimized prompt for Together.ai API.
+    
+    Args:
+        bio: User's LinkedIn bio
+        recent_post: User's recent LinkedIn post
+        industry: User's industry
+        headlines: List of current industry news headlines
+        
+    Returns:
+        Formatted prompt string optimized for viral content
+        
+    Note:
+        bio and recent_post are clipped to MAX_INPUT_CHARS and headlines to
+        MAX_PROMPT_HEADLINES to keep prompt size (and time-to-first-token) bounded.
+    """
+    bio = bio[:MAX_INPUT_CHARS]
+    recent_post = recent_post[:MAX_INPUT_CHARS]
+    headlines = headlines[:MAX_PROMPT_HEADLINES]
+    
+    # Bullet every headline with a single C-level join
+    headlines_text = "• " + "\n• ".join(headlines) if headlines else ""
+    
+    return _VIRAL_TEMPLATE.format_map({
+        'industry': industry,
+        'bio': bio,
+        'recent_post': recent_post,
+        'headlines_text': headlines_text
+    })
+
+def _wait_for_token_budget() -> None:
+    """Block until the rolling one-minute token usage is under TOGETHER_TPM_LIMIT."""
+    if TOGETHER_TPM_LIMIT <= 0:
+        return
+    
+    while True:
+        with _TOKEN_USAGE_LOCK:
+            now = time.monotonic()
+            while _TOKEN_USAGE and now - _TOKEN_USAGE[0][0] >= 60:
+                _TOKEN_USAGE.popleft()
+            used = sum(tokens for _, tokens in _TOKEN_USAGE)
+            if used < TOGETHER_TPM_LIMIT or not _TOKEN_USAGE:
+                return
+            wait = 60 - (now - _TOKEN_USAGE[0][0])
+        time.sleep(wait)
+
+def _record_token_usage(total_tokens: int) -> None:
+    """Add a completed request's token count to the rolling one-minute window."""
+    with _TOKEN_USAGE_LOCK:
+        _TOKEN_USAGE.append((time.monotonic(), total_tokens))
+
+@functools.lru_cache(maxsize=None)
+def _stream_transport_errors() -> Tuple[type, ...]:
+    """
+    Return the transport exceptions the together SDK can let escape mid-stream.
+    
+    1.x streams over requests and 2.x over httpx; neither wraps read errors
+    raised while iterating the response, so both are caught explicitly.
     """
-    Parse the generated content into individual daily posts.
+    import requests
+    
+    errors: List[type] = [requests.RequestException]
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        errors.append(httpx.HTTPError)
+    return tuple(errors)
+
+def call_together_api(prompt: str, api_key: str, model: str = DEFAULT_MODEL,
+                      on_update: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Call Together.ai API using the official Python SDK, streaming tokens as they arrive.
+    
+    Generations are gated by a process-wide semaphore (TOGETHER_MAX_CONCURRENCY)
+    and opening the stream is retried with exponential backoff on rate-limit,
+    timeout or connection errors. The concurrency slot is released while backing off.
     
     Args:
-        content: Raw generated content from API
+        prompt: The prompt to send to the API
+        api_key: Together.ai API key
+        model: Model to use for generation
+        on_update: Optional callback receiving the raw accumulated text on each flush
         
     Returns:
-        Dictionary mapping day numbers to post content
+        Generated content from the API
+        
+    Raises:
+        TogetherAPIError: If API call fails
     """
-    posts = {}
+    try:
+        # These names exist in together.error on both the 1.x and 2.x SDK lines
+        from together.error import APIConnectionError, RateLimitError, Timeout, TogetherException
+    except ImportError as e:
+        raise TogetherAPIError(f"Unsupported together SDK version: {str(e)}") from e
     
-    # Split content by day markers
-    day_pattern = r'\*\*Day (\d+):[^*]*\*\*'
-    day_matches = list(re.finditer(day_pattern, content, re.IGNORECASE))
+    retryable = (APIConnectionError, RateLimitError, Timeout)
     
-    for i, match in enumerate(day_matches):
-        day_num = match.group(1)
-        start_pos = match.end()
+    try:
+        # Reuse the cached Together client for this key
+        client = _get_together_client(api_key)
         
-        # Find the end position (start of next day or end of content)
-        if i + 1 < len(day_matches):
-            end_pos = day_matches[i + 1].start()
-        else:
-            end_pos = len(content)
+        for attempt in range(TOGETHER_MAX_RETRIES):
+            with _TOGETHER_SEM:
+                # Check the budget while holding a slot so concurrent callers can't all pass at once
+                _wait_for_token_budget()
+                try:
+                    response = _open_stream(client, prompt, model)
+                except retryable:
+                    if attempt == TOGETHER_MAX_RETRIES - 1:
+                        raise
+                else:
+                    # Only opening the stream is retried; once tokens are flowing a
+                    # failure is surfaced rather than restarting rendered output
+                    return _consume_stream(response, on_update)
+            time.sleep(2 ** attempt + random.random())
+        
+    except RateLimitError as e:
+        raise TogetherAPIError(f"API rate limit exceeded: {str(e)}") from e
+    except TogetherException as e:
+        raise TogetherAPIError(f"API request failed: {str(e)}") from e
+    except _stream_transport_errors() as e:
+        raise TogetherAPIError(f"API connection interrupted: {str(e)}") from e
+
+def _open_stream(client: "Together", prompt: str, model: str):
+    """Create a streaming chat completion for the prompt."""
+    return client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        max_tokens=3000,
+        temperature=0.8,
+        top_p=0.9,
+        repetition_penalty=1.1,
+        stop=["<|im_end|>", "<|endoftext|>"],
+        stream=True
+    )
+
+def _consume_stream(response, on_update: Optional[Callable[[str], None]]) -> str:
+    """
+    Accumulate a streamed completion, reporting progress and recording token usage.
+    
+    Raises:
+        TogetherAPIError: If the stream produced no content
+    """
+    # Accumulate streamed tokens, throttling UI updates to avoid rerun storms
+    buffer = []
+    last_flush = 0.0
+    total_tokens = None
+    for chunk in response:
+        usage = getattr(chunk, "usage", None)
+        if usage is not None and getattr(usage, "total_tokens", None):
+            total_tokens = usage.total_tokens
+        if not chunk.choices:
+            continue
+        # together 1.x types delta as optional (e.g. on the final usage chunk)
+        delta = chunk.choices[0].delta
+        content = delta.content if delta is not None else None
+        if not content:
+            continue
+        buffer.append(content)
         
-        # Extract post content
-        post_content = content[start_pos:end_pos].strip()
+        now = time.monotonic()
+        if now - last_flush >= STREAM_FLUSH_INTERVAL:
+            if on_update is not None:
+                on_update("".join(buffer))
+            last_flush = now
+    
+    text = "".join(buffer)
+    if on_update is not None:
+        on_update(text)
+    
+    if total_tokens:
+        _record_token_usage(total_tokens)
+    
+    content = text.strip()
+    if not content:
+        raise TogetherAPIError("No content generated by API")
+    return content
+
+class StreamingDayParser:
+    """
+    Incrementally split streamed content into daily posts.
+    
+    Each **Day N:** block is finalized as soon as the next day header arrives,
+    so completed posts can be shown while later days are still generating.
+    Scanning resumes from the last open header, so earlier text is not reparsed.
+    """
+    
+    def __init__(self):
+        self.posts: Dict[str, str] = {}
+        self._buffer = ""
+        self._open: Optional["re.Match"] = None
+    
+    @property
+    def pending_day(self) -> Optional[str]:
+        """Day number currently being written, if any header has been seen."""
+        return self._open.group(1) if self._open else None
+    
+    @property
+    def pending_text(self) -> str:
+        """Partial text of the day being written, or everything so far if no header has arrived."""
+        if self._open is None:
+            return self._buffer.strip()
+        return self._buffer[self._open.end():].strip()
+    
+    def feed(self, buffer: str) -> None:
+        """
+        Scan the accumulated stream and finalize any posts whose successor header has arrived.
         
-        # Clean up the content
-        post_content = re.sub(r'^\n+', '', post_content)
-        post_content = re.sub(r'\n+$', '', post_content)
+        Args:
+            buffer: Full raw text received so far (each call extends the previous one)
+        """
+        self._buffer = buffer
+        scan_from = self._open.start() if self._open else 0
         
-        posts[day_num] = post_content
+        for match in _DAY_RE.finditer(buffer, scan_from):
+            if self._open is not None and match.start() > self._open.start():
+                day_num = self._open.group(1)
+                self.posts[day_num] = buffer[self._open.end():match.start()].strip()
+            self._open = match
     
-    return posts
+    def finish(self) -> Dict[str, str]:
+        """
+        Finalize the trailing post once the stream is complete.
+        
+        Returns:
+            Dictionary mapping day numbers to post content
+        """
+        if self._open is not None:
+            self.posts[self._open.group(1)] = self._buffer[self._open.end():].strip()
+        return self.posts
 
 def display_sidebar():
     """Display the sidebar with app information and viral content tips."""
     st.sidebar.title("🚀 LinkedIn Ghostwriter Pro")
     st.sidebar.markdown("---")
-    
-    st.sidebar.subheader("🎯 Viral Content Strategy:")
-    st.sidebar.markdown("""
-    1. **Profile Analysis**: Bio + recent post voice matching
-    2. **Industry Intelligence**: Real-time news integration
-    3. **Viral Framework**: 7 strategic content types
-    4. **Engagement Optimization**: Psychological triggers included
-    """)
-    
+    st.sidebar.markdown(_SIDEBAR_STRATEGY_MD)
     st.sidebar.markdown("---")
-    st.sidebar.subheader("🔥 Viral Content Types:")
-    st.sidebar.markdown("""
-    - **Controversial Takes**: Challenge industry norms
-    - **Behind-the-Scenes**: Exclusive insights
-    - **Bold Predictions**: Data-backed forecasts
-    - **Failure Stories**: Vulnerability + lessons
-    - **Myth-Busting**: Debunk misconceptions
-    - **Trend Analysis**: Connect news to insights
-    - **Contrarian Views**: Unpopular but valuable
-    """)
-    
+    st.sidebar.markdown(_SIDEBAR_VIRAL_TYPES_MD)
     st.sidebar.markdown("---")
-    st.sidebar.subheader("💡 Engagement Maximizers:")
-    st.sidebar.markdown("""
-    - Strong hooks in first 2 lines
-    - Curiosity gaps and open loops
-    - Interactive call-to-actions
-    - Strategic hashtag placement
-    - Emotional storytelling
-    """)
-    
+    st.sidebar.markdown(_SIDEBAR_ENGAGEMENT_MD)
     st.sidebar.markdown("---")
-    st.sidebar.subheader("🔑 Get Together.ai API Key:")
-    st.sidebar.markdown("""[Sign up at Together.ai](https://together.ai)
-    
-✨ **Free Credits Available!**
-New users get free credits to try the service.""")
+    st.sidebar.markdown(_SIDEBAR_APIKEY_MD)
 
 def main():
     """Main application function."""
@@ -438,6 +803,13 @@ def main():
                     ],
                     help="Choose the overall tone for maximum engagement"
                 )
+                
+                st.checkbox(
+                    "🎈 Celebrate when ready",
+                    value=False,
+                    key="celebrate",
+                    help="Show a balloon animation once your content strategy is generated"
+                )
         
         # Submit button
         submitted = st.form_submit_button("🚀 Generate Viral Content Strategy", use_container_width=True)
@@ -449,16 +821,15 @@ def main():
             st.error("⚠️ Please fill in all required fields to generate your viral content strategy.")
             return
         
+        # Single status container for all progress updates
+        status = st.status("📰 Analyzing real-time industry trends and news...", expanded=False)
+        stream_placeholder = st.empty()
+        
         try:
-            # Show progress with enhanced messaging
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
             # Step 1: Scrape news
-            status_text.text("📰 Analyzing real-time industry trends and news...")
-            progress_bar.progress(20)
-            
-            headlines = scrape_google_news(industry, max_headlines)
+            headlines = asyncio.run(
+                gather_generation_inputs(industry, max_headlines, api_key)
+            )
             
             if not headlines:
                 st.warning("⚠️ Limited recent news found. Proceeding with general industry content generation.")
@@ -469,36 +840,49 @@ def main():
                 ]
             
             # Step 2: Construct viral prompt
-            status_text.text("🧠 Constructing viral-optimized AI prompt strategy...")
-            progress_bar.progress(40)
+            status.update(label="🧠 Constructing viral-optimized AI prompt strategy...")
             
             prompt = construct_viral_prompt(bio, recent_post, industry, headlines)
             
+            if len(bio) > MAX_INPUT_CHARS or len(recent_post) > MAX_INPUT_CHARS:
+                st.caption(f"✂️ Bio and recent post were truncated to {MAX_INPUT_CHARS} characters each.")
+            
             # Step 3: Generate content
-            status_text.text("✨ Generating your viral content strategy (this may take 30-45 seconds)...")
-            progress_bar.progress(70)
+            status.update(label="✨ Generating your viral content strategy...")
             
-            generated_content = call_together_api(prompt, api_key, model)
+            # Show completed days plus the day currently streaming in
+            day_parser = StreamingDayParser()
             
-            # Step 4: Parse and display results
-            status_text.text("📝 Optimizing and formatting your viral posts...")
-            progress_bar.progress(90)
+            def render_stream_progress(text: str) -> None:
+                day_parser.feed(text)
+                sections = [
+                    f"**Day {day_num}**\n\n{post}" for day_num, post in day_parser.posts.items()
+                ]
+                pending = day_parser.pending_day
+                partial = day_parser.pending_text
+                if pending:
+                    sections.append(f"**Day {pending}** ⏳\n\n{partial}")
+                else:
+                    sections.append(partial or "⏳ *Drafting your content plan...*")
+                stream_placeholder.markdown("\n\n---\n\n".join(sections))
             
-            posts = parse_generated_content(generated_content)
+            generated_content = call_together_api(
+                prompt, api_key, model, on_update=render_stream_progress
+            )
+            stream_placeholder.empty()
             
-            # Final step
-            status_text.text("🎉 Your viral content strategy is ready!")
-            progress_bar.progress(100)
+            # Step 4: Finalize the last streamed post
+            status.update(label="📝 Optimizing and formatting your viral posts...")
             
-            time.sleep(0.5)  # Brief pause for effect
+            posts = day_parser.finish()
             
-            # Clear progress indicators
-            progress_bar.empty()
-            status_text.empty()
+            # Final step
+            status.update(label="🎉 Your viral content strategy is ready!", state="complete")
             
             # Display results with enhanced styling
             st.success("🎉 **Your Viral Content Strategy is Ready!**")
-            st.balloons()
+            if st.session_state.get("celebrate", False):
+                st.balloons()
             
             # Results summary
             col1, col2, col3 = st.columns(3)
@@ -530,26 +914,18 @@ def main():
                 
                 for i, (day_num, tab) in enumerate(zip(sorted(posts.keys(), key=int), tabs)):
                     with tab:
-                        st.markdown(f"### Day {day_num} Content")
-                        
-                        # Display post content
-                        st.markdown("**Preview:**")
-                        st.markdown(posts[day_num])
+                        # Header and preview rendered as one block
+                        st.markdown(
+                            f"### Day {day_num} Content\n\n"
+                            f"**Preview:**\n\n{posts[day_num]}\n\n"
+                            "**Copy for LinkedIn:**"
+                        )
                         
                         # Copy functionality
-                        st.markdown("**Copy for LinkedIn:**")
                         st.code(posts[day_num], language=None)
                         
                         # Engagement tips
-                        st.markdown("**💡 Posting Tips:**")
-                        st.markdown("""
-                        - Post during peak hours (8-10 AM, 12-2 PM, 5-6 PM)
-                        - Engage with comments within first 2 hours
-                        - Share in relevant LinkedIn groups
-                        - Tag relevant industry connections
-                        """)
-                        
-                        st.markdown("---")
+                        st.markdown(_POSTING_TIPS_MD)
                 
                 # Additional strategic advice
                 st.markdown("---")
@@ -582,14 +958,20 @@ def main():
                 st.text_area("Raw Generated Content", generated_content, height=500)
                 
         except NewsScraperError as e:
+            status.update(state="error")
+            stream_placeholder.empty()
             st.error(f"📰 News scraping encountered an issue: {str(e)}")
             st.info("💡 Don't worry - we can still generate excellent content based on your profile and industry knowledge.")
             
         except TogetherAPIError as e:
+            status.update(state="error")
+            stream_placeholder.empty()
             st.error(f"🤖 Content generation failed: {str(e)}")
             st.info("💡 Please verify your API key and ensure you have sufficient credits. Together.ai offers free credits when you sign up at together.ai")
             
         except Exception as e:
+            status.update(state="error")
+            stream_placeholder.empty()
             st.error(f"⚠️ An unexpected error occurred: {str(e)}")
             st.info("💡 Please try again or contact support if the issue persists.")
 